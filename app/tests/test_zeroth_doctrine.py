@@ -5,7 +5,13 @@ Tests the Expo React Native web app with:
   1. curl-based HTTP smoke tests (no browser needed)
   2. Selenium WebDriver integration tests (headless Chrome)
 
+Browser tests run against every device profile in DEVICE_PROFILES
+(desktop, tablet, touch phone). The script entry point runs the profiles
+in parallel, one process and Chrome session each; unittest/pytest
+discovery runs the same per-profile classes one after another.
+
 Run from app/: source .venv/bin/activate && python tests/test_zeroth_doctrine.py
+Run one profile: python tests/test_zeroth_doctrine.py --profile phone
 """
 
 import subprocess
@@ -14,12 +20,44 @@ import time
 import json
 import unittest
 import re
+import io
+import argparse
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
 
 # ─── Configuration ────────────────────────────────────────────
 BASE_URL = "http://localhost:8099"
 HEADLESS = True
 SELENIUM_AVAILABLE = False
 
+# Device profiles for the browser pool. Touch profiles use Chrome mobile
+# emulation so `isTouchDevice` is true and TouchControls renders. Pixel
+# ratio stays at 1 so swiftshader renders a viewport-sized canvas.
+DEVICE_PROFILES = {
+    "desktop": {"width": 1280, "height": 720,
+                "touch": False, "user_agent": None},
+    "tablet": {"width": 1024, "height": 768,
+               "touch": True,
+               "user_agent": ("Mozilla/5.0 (iPad; CPU OS 17_0 like Mac OS X) "
+                              "AppleWebKit/605.1.15 (KHTML, like Gecko) "
+                              "Version/17.0 Mobile/15E148 Safari/604.1")},
+    "phone": {"width": 390, "height": 844,
+              "touch": True,
+              "user_agent": ("Mozilla/5.0 (Linux; Android 14; Pixel 8) "
+                             "AppleWebKit/537.36 (KHTML, like Gecko) "
+                             "Chrome/124.0 Mobile Safari/537.36")},
+}
+
+# Free-explore control hints rendered by CinematicOverlay per isTouchDevice
+TOUCH_HINT = "Drag to fly  |  Look around  |  Tap orbs to visit"
+DESKTOP_HINT = "WASD to fly  |  Drag to look  |  Click orbs to visit"
+
+# Mirrors src/data/doctrine.ts INTRO_DURATION and the per-frame delta cap
+# in CinematicDirector: the intro needs INTRO_DURATION / FRAME_DELTA_CAP
+# rendered frames at minimum, however slow the renderer is.
+INTRO_DURATION = 6
+FRAME_DELTA_CAP = 0.1
+
 try:
     from selenium import webdriver
     from selenium.webdriver.chrome.options import Options
@@ -254,16 +292,30 @@ class TestSeleniumBrowser(unittest.TestCase):
     """Integration tests using headless Chrome via Selenium WebDriver."""
 
     driver = None
+    profile_name = "desktop"
 
     @classmethod
     def setUpClass(cls):
+        cls.profile = DEVICE_PROFILES[cls.profile_name]
         options = Options()
         if HEADLESS:
             options.add_argument("--headless=new")
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1280,720")
+        options.add_argument(
+            f"--window-size={cls.profile['width']},{cls.profile['height']}")
+        if cls.profile["touch"]:
+            # Emulate a touch device with a reduced viewport
+            emulation = {"deviceMetrics": {
+                "width": cls.profile["width"],
+                "height": cls.profile["height"],
+                "pixelRatio": 1.0,
+                "touch": True,
+            }}
+            if cls.profile["user_agent"]:
+                emulation["userAgent"] = cls.profile["user_agent"]
+            options.add_experimental_option("mobileEmulation", emulation)
         # Enable WebGL in headless
         options.add_argument("--enable-webgl")
         options.add_argument("--use-gl=swiftshader")
@@ -276,6 +328,22 @@ class TestSeleniumBrowser(unittest.TestCase):
         cls.driver.get(BASE_URL)
         # Wait for React to mount and Three.js to initialize
         time.sleep(8)
+        # Touch profiles get a fullscreen prompt over the whole app
+        cls.fullscreen_prompt_shown = cls._dismiss_fullscreen_prompt()
+
+    @classmethod
+    def _dismiss_fullscreen_prompt(cls):
+        """Click SKIP on the TouchControls fullscreen prompt if shown."""
+        return bool(cls.driver.execute_script("""
+            var buttons = document.querySelectorAll('button');
+            for (var i = 0; i < buttons.length; i++) {
+                if (buttons[i].textContent.trim() === 'SKIP') {
+                    buttons[i].click();
+                    return true;
+                }
+            }
+            return false;
+        """))
 
     @classmethod
     def tearDownClass(cls):
@@ -332,6 +400,104 @@ class TestSeleniumBrowser(unittest.TestCase):
         """Get full DOM source."""
         return self.driver.page_source
 
+    def _has_touch_layer(self):
+        """Whether the TouchControls `touch-action: none` layer is mounted."""
+        return self.driver.execute_script("""
+            var divs = document.querySelectorAll('#root div');
+            for (var i = 0; i < divs.length; i++) {
+                if (divs[i].style.touchAction === 'none') return true;
+            }
+            return false;
+        """)
+
+    def _wait_for_dom_text(self, predicate, timeout=20):
+        """Poll the root textContent until predicate(text) is true."""
+        deadline = time.time() + timeout
+        text = self._get_dom_text()
+        while not predicate(text) and time.time() < deadline:
+            time.sleep(0.5)
+            text = self._get_dom_text()
+        return predicate(text)
+
+    def _webgl_available(self):
+        """Whether the canvas has a WebGL context (useFrame loop runs)."""
+        return self.driver.execute_script("""
+            const c = document.querySelector('canvas');
+            if (!c) return false;
+            try {
+                const gl = c.getContext('webgl2') || c.getContext('webgl');
+                return !!gl;
+            } catch(e) { return false; }
+        """)
+
+    def _measure_fps(self, sample_ms=1000):
+        """Count requestAnimationFrame callbacks over a short sample."""
+        return self.driver.execute_async_script("""
+            var done = arguments[arguments.length - 1];
+            var sample = arguments[0], frames = 0, start = performance.now();
+            function tick(now) {
+                frames++;
+                if (now - start < sample) requestAnimationFrame(tick);
+                else done(frames * 1000 / (now - start));
+            }
+            requestAnimationFrame(tick);
+        """, sample_ms)
+
+    def _restart_into_touring(self):
+        """Reload the app and wait until the intro hands over to the tour.
+
+        Skips the test when WebGL is unavailable, since the tour state
+        machine is driven by the useFrame loop.
+        """
+        if not self._webgl_available():
+            self.skipTest("WebGL unavailable - tour state machine requires GPU")
+        self.driver.refresh()
+        fps = max(self._measure_fps(), 1.0)
+        # Elapsed intro time advances by at most FRAME_DELTA_CAP per frame
+        intro_wall = max(INTRO_DURATION,
+                         INTRO_DURATION / (FRAME_DELTA_CAP * fps))
+        # Intro overlay unmounts and no free-explore hint is shown yet
+        touring = self._wait_for_dom_text(
+            lambda t: (t.strip() != ""
+                       and "A Calculus of Totality" not in t
+                       and TOUCH_HINT not in t
+                       and DESKTOP_HINT not in t),
+            timeout=intro_wall * 2 + 5)
+        self.assertTrue(touring, f"App never reached the touring phase "
+                                 f"(~{fps:.0f} fps)")
+        self._dismiss_fullscreen_prompt()
+
+    def _tap_to_pause_tour(self):
+        """Tap the centre of the touch layer and wait for free explore."""
+        width = self.driver.execute_script("return window.innerWidth")
+        height = self.driver.execute_script("return window.innerHeight")
+        hit = self._dispatch_touch("touchstart", width / 2, height / 2)
+        self.assertNotEqual(hit, "NOT_TOUCH_LAYER",
+                            "Center of screen is not the touch layer")
+        self._dispatch_touch("touchend", width / 2, height / 2)
+        self.assertTrue(self._wait_for_dom_text(lambda t: TOUCH_HINT in t,
+                                                timeout=5),
+                        f"Free-explore hint '{TOUCH_HINT}' not shown")
+
+    def _dispatch_touch(self, event_type, x, y, identifier=1):
+        """Dispatch a TouchEvent on whatever element is at (x, y).
+
+        Returns the tag of the hit element, or 'NOT_TOUCH_LAYER' when the
+        element at that point is not the TouchControls layer.
+        """
+        return self.driver.execute_script("""
+            var type = arguments[0], x = arguments[1], y = arguments[2];
+            var el = document.elementFromPoint(x, y);
+            if (!el || el.style.touchAction !== 'none') return 'NOT_TOUCH_LAYER';
+            var t = new Touch({identifier: arguments[3], target: el,
+                               clientX: x, clientY: y});
+            var active = type === 'touchend' ? [] : [t];
+            el.dispatchEvent(new TouchEvent(type, {
+                touches: active, targetTouches: active, changedTouches: [t],
+                bubbles: true, cancelable: true}));
+            return el.tagName;
+        """, event_type, x, y, identifier)
+
     # ── Tests ──
 
     def test_01_page_loads_with_title(self):
@@ -480,14 +646,7 @@ class TestSeleniumBrowser(unittest.TestCase):
     def test_10_click_interaction(self):
         """Clicking the canvas triggers a state change (tour interruption)."""
         # Check if WebGL is available - tour state machine requires useFrame loop
-        webgl_ok = self.driver.execute_script("""
-            const c = document.querySelector('canvas');
-            if (!c) return false;
-            try {
-                const gl = c.getContext('webgl2') || c.getContext('webgl');
-                return !!gl;
-            } catch(e) { return false; }
-        """)
+        webgl_ok = self._webgl_available()
 
         if not webgl_ok:
             # Without WebGL, Three.js useFrame loop doesn't run,
@@ -614,12 +773,184 @@ class TestSeleniumBrowser(unittest.TestCase):
         self.assertTrue(result, "App is not responsive after interactions")
         print("  PASS: App still alive and responsive")
 
+    def test_15_viewport_matches_profile(self):
+        """Viewport width matches the device profile."""
+        width = self.driver.execute_script("return window.innerWidth")
+        self.assertEqual(width, self.profile["width"],
+                         f"Viewport is {width}px, expected "
+                         f"{self.profile['width']}px for '{self.profile_name}'")
+        print(f"  PASS: Viewport is {width}px ({self.profile_name})")
+
+    def test_16_touch_controls_match_profile(self):
+        """TouchControls renders only on touch profiles."""
+        has_layer = self._has_touch_layer()
+        text = self._get_dom_text()
+        if self.profile["touch"]:
+            self.assertTrue(has_layer, "TouchControls layer not rendered")
+            fullscreen = self.driver.execute_script(
+                "return !!(document.fullscreenEnabled || "
+                "document.webkitFullscreenEnabled)")
+            if fullscreen:
+                self.assertTrue(self.fullscreen_prompt_shown,
+                                "Fullscreen prompt was not shown")
+        else:
+            self.assertFalse(has_layer,
+                             "TouchControls layer rendered on desktop")
+            self.assertFalse(self.fullscreen_prompt_shown,
+                             "Fullscreen prompt shown on desktop")
+            self.assertNotIn("TAP FOR FULLSCREEN", text)
+        print(f"  PASS: TouchControls present={has_layer} "
+              f"({self.profile_name})")
+
+    def test_17_tour_interrupt_uses_profile_input(self):
+        """Tap (touch) or WASD (desktop) pauses the tour into free explore."""
+        self._restart_into_touring()
+        if self.profile["touch"]:
+            self._tap_to_pause_tour()
+            self.assertNotIn(DESKTOP_HINT, self._get_dom_text())
+        else:
+            ActionChains(self.driver).send_keys("w").perform()
+            self.assertTrue(
+                self._wait_for_dom_text(lambda t: DESKTOP_HINT in t,
+                                        timeout=5),
+                f"Free-explore hint '{DESKTOP_HINT}' not shown")
+            self.assertNotIn(TOUCH_HINT, self._get_dom_text())
+        print(f"  PASS: Tour paused into free explore ({self.profile_name})")
+
+    def test_18_touch_joystick_activates(self):
+        """Touching the left half shows the move joystick (touch only)."""
+        if not self.profile["touch"]:
+            self.skipTest("Not a touch profile")
+        self._restart_into_touring()
+        self._tap_to_pause_tour()
+        width = self.driver.execute_script("return window.innerWidth")
+        height = self.driver.execute_script("return window.innerHeight")
+        x, y = width / 4, height / 2
+        hint_labels = "return Array.from(document.querySelectorAll('span'))" \
+                      ".map(function (s) { return s.textContent; })"
+
+        self.assertIn("Move", self.driver.execute_script(hint_labels))
+        hit = self._dispatch_touch("touchstart", x, y)
+        self.assertNotEqual(hit, "NOT_TOUCH_LAYER",
+                            "Left half of screen is not the touch layer")
+        time.sleep(0.3)
+        # The idle "Move" hint is replaced by the active joystick
+        self.assertNotIn("Move", self.driver.execute_script(hint_labels),
+                         "Move joystick did not activate on touch")
+
+        self._dispatch_touch("touchend", x, y)
+        time.sleep(0.3)
+        self.assertIn("Move", self.driver.execute_script(hint_labels),
+                      "Move joystick did not release on touch end")
+        print(f"  PASS: Move joystick tracks touch ({self.profile_name})")
+
+
+class TestSeleniumBrowserTablet(TestSeleniumBrowser):
+    """Browser tests on the emulated touch tablet profile."""
+
+    profile_name = "tablet"
+
+
+class TestSeleniumBrowserPhone(TestSeleniumBrowser):
+    """Browser tests on the emulated touch phone profile."""
+
+    profile_name = "phone"
+
+
+# ═══════════════════════════════════════════════════════════════
+# PART 3: PARALLEL BROWSER POOL
+# ═══════════════════════════════════════════════════════════════
+
+PROFILE_TEST_CASES = {
+    c.profile_name: c
+    for c in (TestSeleniumBrowser, TestSeleniumBrowserTablet,
+              TestSeleniumBrowserPhone)
+}
+assert set(PROFILE_TEST_CASES) == set(DEVICE_PROFILES), \
+    "Every DEVICE_PROFILES entry needs a TestSeleniumBrowser subclass"
+
+
+def _run_profile(profile_name):
+    """Run the browser tests for one profile (in a worker process).
+
+    Captures both unittest output and the tests' own prints so each
+    profile's log stays in one piece.
+    """
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromTestCase(PROFILE_TEST_CASES[profile_name])
+    stream = io.StringIO()
+    start = time.time()
+    with redirect_stdout(stream):
+        result = unittest.TextTestRunner(stream=stream, verbosity=2).run(suite)
+    return {
+        "profile": profile_name,
+        "run": result.testsRun,
+        "failures": len(result.failures) + len(result.errors),
+        "skipped": len(result.skipped),
+        "elapsed": time.time() - start,
+        "output": stream.getvalue(),
+    }
+
+
+def resolve_profiles(profiles=None):
+    """Return the profile names to run, defaulting to all of them.
+
+    Raises ValueError for an empty selection or an unknown name.
+    """
+    profiles = list(profiles if profiles is not None else DEVICE_PROFILES)
+    if not profiles:
+        raise ValueError("No device profiles given")
+    unknown = [p for p in profiles if p not in DEVICE_PROFILES]
+    if unknown:
+        raise ValueError(f"Unknown device profile(s): {', '.join(unknown)}; "
+                         f"expected one of {', '.join(DEVICE_PROFILES)}")
+    return profiles
+
+
+def run_browser_pool(profiles=None):
+    """Run the browser tests against several profiles in parallel.
+
+    Each profile gets its own process and Chrome session. Returns a list
+    of per-profile dicts (profile, run, failures, skipped, elapsed, output).
+    """
+    profiles = resolve_profiles(profiles)
+    with ProcessPoolExecutor(max_workers=len(profiles)) as pool:
+        return list(pool.map(_run_profile, profiles))
+
+
+def print_pool_report(reports, wall_time):
+    """Print per-profile output and a merged results/timing table."""
+    for r in reports:
+        print(f"\n── Profile: {r['profile']} " + "─" * 40)
+        print(r["output"])
+    print("\n" + "-" * 60)
+    print(f"{'PROFILE':<10} {'RUN':>5} {'FAIL':>5} {'SKIP':>5} {'TIME':>8}")
+    for r in reports:
+        print(f"{r['profile']:<10} {r['run']:>5} {r['failures']:>5} "
+              f"{r['skipped']:>5} {r['elapsed']:>7.1f}s")
+    session_time = sum(r["elapsed"] for r in reports)
+    print(f"Pool wall time: {wall_time:.1f}s "
+          f"(sequential would be ~{session_time:.1f}s)")
+    print("-" * 60)
+
 
 # ═══════════════════════════════════════════════════════════════
 # RUNNER
 # ═══════════════════════════════════════════════════════════════
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument(
+        "--profile", type=lambda v: [p for p in v.split(",") if p],
+        help="comma-separated device profiles to run "
+             f"(default: all of {', '.join(DEVICE_PROFILES)})")
+    args = parser.parse_args()
+    try:
+        profiles = resolve_profiles(args.profile)
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        sys.exit(2)
+
     print("=" * 60)
     print("ZEROTH DOCTRINE - WEB EXPERIENCE TEST SUITE")
     print(f"Target: {BASE_URL}")
@@ -649,20 +980,25 @@ if __name__ == "__main__":
     # Add curl tests first (fast, no browser)
     suite.addTests(loader.loadTestsFromTestCase(TestCurlSmoke))
 
-    # Add selenium tests if available
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    total = result.testsRun
+    failures = len(result.failures) + len(result.errors)
+    skipped = len(result.skipped)
+
+    # Run selenium tests across the device profiles in parallel
     if SELENIUM_AVAILABLE:
-        suite.addTests(loader.loadTestsFromTestCase(TestSeleniumBrowser))
+        start = time.time()
+        reports = run_browser_pool(profiles)
+        print_pool_report(reports, time.time() - start)
+        total += sum(r["run"] for r in reports)
+        failures += sum(r["failures"] for r in reports)
+        skipped += sum(r["skipped"] for r in reports)
     else:
         print("SKIPPING Selenium tests (not installed)\n")
 
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-
     # Summary
     print("\n" + "=" * 60)
-    total = result.testsRun
-    failures = len(result.failures) + len(result.errors)
-    skipped = len(result.skipped)
     passed = total - failures - skipped
     print(f"RESULTS: {passed}/{total} passed, {failures} failed, {skipped} skipped")
     print("=" * 60)